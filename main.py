@@ -1,21 +1,26 @@
 
+from argparse import ArgumentParser
 from pathlib import Path
 from time import sleep
 
 from src.config.structure import Structure
-from pandas import DataFrame, read_excel
+from src.core.order_writer import OrderWriter
+from src.core.price_cache import PriceCache
+from src.packages import fast_copy, fast_paste
+from pandas import DataFrame, read_excel, read_parquet
 import pyautogui
-import pyperclip
+
+pyautogui.PAUSE = 0
+
+_DIGIT_FILTER = str.maketrans("", "", ",. \u00a0")
+PRICE_READ_ATTEMPTS = 3
 
 def get_structure():
     return Structure()
 
-orders_file = Path("fort_sterling_orders.xlsx")
-if not orders_file.exists():
-    df = DataFrame(columns=["Item", "Price"])
-else:
-    df = read_excel(orders_file)
-struct = get_structure()
+
+ORDERS_FILE = Path("fort_sterling_orders.parquet")
+LEGACY_ORDERS_FILE = Path("fort_sterling_orders.xlsx")
 
 MAP_ITEMS = {
     "mage": ["cowl", "robe", "sandals"],
@@ -23,158 +28,249 @@ MAP_ITEMS = {
     "ranger": ["hood", "jacket", "shoes"]
 }
 
+ROYAL_NAMES = {
+    item: f"royal {item}" for items in MAP_ITEMS.values() for item in items
+}
+
+TIER_OFFSETS = tuple(135 + 27 * i for i in range(5))
+ENCHANT_OFFSETS = tuple(54 + 27 * j for j in range(5))
+
+SKIP = frozenset(
+    f"{item} {tier} {enchant}"
+    for items in MAP_ITEMS.values()
+    for item in items
+    for tier, enchant in ((4, 3), (3, 3))
+)
+
+ITEM_NUMBER_MAP = {
+    item: 96 for item in ("hood", "cowl", "helmet", "shoes", "boots", "sandals")
+} | {item: 192 for item in ("jacket", "robe", "armor")}
+
+
+def load_orders():
+    """Loads the orders file, migrating the legacy xlsx sheet once."""
+    if ORDERS_FILE.exists():
+        return read_parquet(ORDERS_FILE, engine="pyarrow")
+    if LEGACY_ORDERS_FILE.exists():
+        df = read_excel(LEGACY_ORDERS_FILE)
+        df.to_parquet(ORDERS_FILE, engine="pyarrow", index=False)
+        return df
+    return DataFrame(columns=["Item", "Price"])
+
+
+def _run(df, struct):
+    """Places or raises the buy orders of every item in MAP_ITEMS."""
+    price_index = dict(zip(df.Item, df.Price))
+    writer = OrderWriter(df, ORDERS_FILE)
+    price_cache = PriceCache("price_cache.json", ttl=60)
+
+    # struct.BOUGHT_ORDERS.click()
+
+    # indices_to_remove = []
+    # for row in df.itertuples():
+    #     item_name, tier, enchant = row.Item.split()
+    #     struct.SEARCH.paste_insert(f"royal {item_name}")
+    #     struct.TIER.click()
+    #     struct.TIER.click(offset=(0, 135 + (int(tier) * 27)))
+    #     struct.ENCHANTMENT.click()
+    #     struct.ENCHANTMENT.click(offset=(0, 54 + (int(enchant) * 27)))
+    #     sleep(0.01)
+    #     visible = struct.TAKE_ITEM.visible(timeout=0.6)
+    #     if visible:
+    #         struct.TAKE_ITEM.click()
+    #         indices_to_remove.append(row.Index)
+    #         if int(tier) > 3:
+    #             continue
+    #         if int(enchant) == 0:
+    #             struct.ORDERS.click()
+    #             struct.CATEGORY.click()
+    #             struct.MATERIALS.click()
+    #             struct.RUNE.click()
+    #             struct.BUY_ORDER_BUTTON.click()
+    #             item_number = ITEM_NUMBER_MAP[item_name]
+    #             struct.ITEM_NUMBER.paste_insert(str(item_number))
+    #             struct.ADD_ITEM_SILVER.click()
+    #             struct.CREATE_BUY_ORDER.click()
+    #             struct.CONFIRM_BUY_ORDER.click()
+    #             struct.CATEGORY.click()
+    #             struct.MATERIALS.click()
+    #             struct.SOUL.click()
+    #             struct.BUY_ORDER_BUTTON.click()
+    #             item_number = ITEM_NUMBER_MAP[item_name]
+    #             struct.ITEM_NUMBER.paste_insert(str(item_number))
+    #             struct.ADD_ITEM_SILVER.click()
+    #             struct.CREATE_BUY_ORDER.click()
+    #             struct.CONFIRM_BUY_ORDER.click()
+    #             struct.CATEGORY.click()
+    #             struct.CATEGORY.click(offset=(0, 81))
+    #         if int(enchant) == 1:
+    #             struct.ORDERS.click()
+    #             struct.CATEGORY.click()
+    #             struct.MATERIALS.click()
+    #             struct.SOUL.click()
+    #             struct.BUY_ORDER_BUTTON.click()
+    #             item_number = ITEM_NUMBER_MAP[item_name]
+    #             struct.ITEM_NUMBER.paste_insert(str(item_number))
+    #             struct.ADD_ITEM_SILVER.click()
+    #             struct.CREATE_BUY_ORDER.click()
+    #             struct.CONFIRM_BUY_ORDER.click()
+    #             struct.CATEGORY.click()
+    #             struct.CATEGORY.click(offset=(0, 81))
+
+    # df.drop(indices_to_remove, inplace=True)
 
-# struct.BOUGHT_ORDERS.click()
-
-# indices_to_remove = []
-# for row in df.itertuples():
-#     item_name, tier, enchant = row.Item.split()
-#     struct.SEARCH.insert(f"royal {item_name}")
-#     struct.TIER.click()
-#     struct.TIER.click(offset=(0, 135 + (int(tier) * 27)))
-#     struct.ENCHANTMENT.click()
-#     struct.ENCHANTMENT.click(offset=(0, 54 + (int(enchant) * 27)))
-#     sleep(0.01)
-#     visible = struct.TAKE_ITEM.visible(timeout=0.01)
-#     if visible:
-#         struct.TAKE_ITEM.click()
-#         indices_to_remove.append(row.Index)
-#         if int(tier) > 3:
-#             continue
-#         if int(enchant) == 0:
-#             struct.ORDERS.click()
-#             struct.CATEGORY.click()
-#             struct.MATERIALS.click()
-#             struct.RUNE.click()
-#             struct.BUY_ORDER_BUTTON.click()
-#             item_number = 0
-#             if item_name in ["hood", "cowl", "helmet", "shoes", "boots", "sandals"]:
-#                 item_number = 96
-#             elif item_name in ["jacket", "robe", "armor"]:
-#                 item_number = 192
-#             struct.ITEM_NUMBER.insert(str(item_number))
-#             struct.ADD_ITEM_SILVER.click()
-#             struct.CREATE_BUY_ORDER.click()
-#             struct.CONFIRM_BUY_ORDER.click()
-#             struct.CATEGORY.click()
-#             struct.MATERIALS.click()
-#             struct.SOUL.click()
-#             struct.BUY_ORDER_BUTTON.click()
-#             item_number = 0
-#             if item_name in ["hood", "cowl", "helmet", "shoes", "boots", "sandals"]:
-#                 item_number = 96
-#             elif item_name in ["jacket", "robe", "armor"]:
-#                 item_number = 192
-#             struct.ITEM_NUMBER.insert(str(item_number))
-#             struct.ADD_ITEM_SILVER.click()
-#             struct.CREATE_BUY_ORDER.click()
-#             struct.CONFIRM_BUY_ORDER.click()
-#             struct.CATEGORY.click()
-#             struct.CATEGORY.click(offset=(0, 81))
-#         if int(enchant) == 1:
-#             struct.ORDERS.click()
-#             struct.CATEGORY.click()
-#             struct.MATERIALS.click()
-#             struct.SOUL.click()
-#             struct.BUY_ORDER_BUTTON.click()
-#             item_number = 0
-#             if item_name in ["hood", "cowl", "helmet", "shoes", "boots", "sandals"]:
-#                 item_number = 96
-#             elif item_name in ["jacket", "robe", "armor"]:
-#                 item_number = 192
-#             struct.ITEM_NUMBER.insert(str(item_number))
-#             struct.ADD_ITEM_SILVER.click()
-#             struct.CREATE_BUY_ORDER.click()
-#             struct.CONFIRM_BUY_ORDER.click()
-#             struct.CATEGORY.click()
-#             struct.CATEGORY.click(offset=(0, 81))
-
-# df.drop(indices_to_remove, inplace=True)
-
-struct.CATEGORY.click()
-struct.CATEGORY.click(offset=(0, 81))
-
-struct.ORDERS.click()
-for category, items in MAP_ITEMS.items():
-    for item in items:
-        struct.SEARCH.insert(f"royal {item}")
-        tier_init = 135
-        for i in range(5):
-            enchantment_init = 54
+    struct.CATEGORY.click()
+    struct.CATEGORY.click(offset=(0, 81))
+
+    last_tier = last_enc = None
+    current_search = None
+    current_quality = None
+
+    def search_item(item):
+        """Types the item in the market search unless it is already filtered."""
+        nonlocal current_search
+        if item != current_search:
+            struct.SEARCH.paste_insert(ROYAL_NAMES[item])
+            current_search = item
+
+    def select_filters(t_off, e_off):
+        """Selects tier and enchantment, skipping dropdowns already selected."""
+        nonlocal last_tier, last_enc
+        if last_tier != t_off:
             struct.TIER.click()
-            struct.TIER.click(offset=(0, tier_init))
-            for j in range(5):
-                struct.ENCHANTMENT.click()
-                struct.ENCHANTMENT.click(offset=(0, enchantment_init))
-                item_name = f"{item} {i} {j}"
-                if item_name == f"{item} 4 3" or item_name == f"{item} 3 3":
-                    continue
-                struct.BUY_ORDER_BUTTON.click()
-                highest_price = 0
-                found = df[df.Item == item_name]
-                casted_value_found = 0
-                for quality in range(4):
-                    if casted_value_found > 62000:
-                        continue
-                    struct.QUALITY_SELECTOR.click()
-                    struct.QUALITY_SELECTOR.click(offset=(0, (quality + 1) * 27))
-                    struct.PRICE_INPUT.click(offset=(100, 0))
-                    pyautogui.hotkey("ctrl", "c")
-                    value = pyperclip.paste()
-                    casted_value = int(value)
-                    previous_price = df.loc[found.index.values[0], "Price"] if not found.empty else None
-                    if previous_price is not None:
-                        if casted_value == previous_price:
+            struct.TIER.click(offset=(0, t_off))
+            last_tier = t_off
+        if last_enc != e_off:
+            struct.ENCHANTMENT.click()
+            struct.ENCHANTMENT.click(offset=(0, e_off))
+            last_enc = e_off
+
+    def select_quality(quality):
+        """Selects a quality in the buy order window unless already set."""
+        nonlocal current_quality
+        if current_quality != quality:
+            struct.QUALITY_SELECTOR.click()
+            struct.QUALITY_SELECTOR.click(offset=(0, (quality + 1) * 27))
+            current_quality = quality
+
+    def forget_filters():
+        """Forgets the search and filters, a tab switch may not keep them."""
+        nonlocal current_search, last_tier, last_enc
+        current_search = None
+        last_tier = last_enc = None
+
+    def read_price(quality):
+        """
+        Copies the price of a quality from the buy order window.
+
+        Returns:
+            int | None: The price, None if no number could be read.
+        """
+        select_quality(quality)
+        for _ in range(PRICE_READ_ATTEMPTS):
+            struct.PRICE_INPUT.click(offset=(100, 0))
+            if not fast_copy():
+                continue
+            digits = fast_paste().translate(_DIGIT_FILTER)
+            if digits.isdecimal():
+                return int(digits)
+        return None
+
+    def update_existing_order(item, t_off, e_off):
+        """
+        Removes the registered order of the current item so a new one can
+        be placed, leaving the buy order window of the item open. The search
+        and filters are selected again in the registered orders tab so the
+        removed order is the one of the current item. The market tab then
+        shows the same selection, whether the tabs share it or not.
+        """
+        nonlocal current_quality
+        struct.CLOSE_BUY_ORDER.click()
+        struct.REGISTERED_ORDERS.click()
+        current_quality = None
+        forget_filters()
+        search_item(item)
+        select_filters(t_off, e_off)
+        struct.REMOVE_OLD_ORDER.click()
+        struct.ORDERS.click()
+        struct.BUY_ORDER_BUTTON.click()
+
+    try:
+        struct.ORDERS.click()
+        for category, items in MAP_ITEMS.items():
+            for item in items:
+                search_item(item)
+                for i, t_off in enumerate(TIER_OFFSETS):
+                    for j, e_off in enumerate(ENCHANT_OFFSETS):
+                        select_filters(t_off, e_off)
+                        item_name = f"{item} {i} {j}"
+                        if item_name in SKIP:
                             continue
-                    if casted_value > 72000 and i <= 1:
-                        casted_value_found = casted_value
-                        continue
-                    elif casted_value > 120000:
-                        casted_value_found = casted_value
-                        continue
-                    elif casted_value < 10000:
-                        highest_price = 10000
-                    else:
-                        highest_price = casted_value if casted_value > highest_price else highest_price
-                if highest_price == 0:
-                    struct.CLOSE_BUY_ORDER.click()
-                    enchantment_init += 27
-                    continue
-                if found.empty:
-                    df.loc[len(df)] = [item_name, highest_price + 1]
-                    struct.QUALITY_SELECTOR.click()
-                    struct.QUALITY_SELECTOR.click(offset=(0, 27))
-                    struct.PRICE_INPUT.insert(str(highest_price + 1), offset=(100, 0))
-                    struct.CREATE_BUY_ORDER.click()
-                    struct.CONFIRM_BUY_ORDER.click()
-                else:
-                    previous_price = df.loc[found.index.values[0], "Price"]
-                    if highest_price > previous_price:
-                        struct.CLOSE_BUY_ORDER.click()
-                        struct.REGISTERED_ORDERS.click()
-                        struct.SEARCH.insert(f"royal {item}")
-                        struct.TIER.click()    
-                        struct.TIER.click(offset=(0, tier_init))
-                        struct.ENCHANTMENT.click()
-                        struct.ENCHANTMENT.click(offset=(0, enchantment_init))
-                        struct.REMOVE_OLD_ORDER.click()
-                        struct.ORDERS.click()
                         struct.BUY_ORDER_BUTTON.click()
-                        df.loc[found.index.values[0], "Price"] = highest_price + 1
-                        struct.QUALITY_SELECTOR.click()
-                        struct.QUALITY_SELECTOR.click(offset=(0, 27))
-                        struct.PRICE_INPUT.insert(str(highest_price + 1), offset=(100, 0))
-                        struct.CREATE_BUY_ORDER.click()
-                        struct.CONFIRM_BUY_ORDER.click()
-                struct.CLOSE_BUY_ORDER.click()
-                enchantment_init += 27
-            tier_init += 27
+                        highest_price = 0
+                        entry = price_index.get(item_name)
+                        for quality in range(4):
+                            casted_value = price_cache.get(item_name, quality)
+                            if casted_value is None:
+                                casted_value = read_price(quality)
+                                if casted_value is None:
+                                    continue
+                                price_cache.set(item_name, quality, casted_value)
+                            if entry is not None:
+                                if casted_value == entry:
+                                    continue
+                            if casted_value > 72000 and i <= 1:
+                                break
+                            elif casted_value > 120000:
+                                break
+                            elif casted_value < 10000:
+                                highest_price = 10000
+                            else:
+                                highest_price = casted_value if casted_value > highest_price else highest_price
+                        if highest_price == 0:
+                            struct.CLOSE_BUY_ORDER.click()
+                            current_quality = None
+                            continue
+                        if entry is None:
+                            writer.upsert(item_name, highest_price + 1)
+                            price_index[item_name] = highest_price + 1
+                            select_quality(0)
+                            struct.PRICE_INPUT.paste_insert(str(highest_price + 1), offset=(100, 0))
+                            struct.CREATE_BUY_ORDER.click()
+                            struct.CONFIRM_BUY_ORDER.click()
+                        else:
+                            if highest_price > entry:
+                                update_existing_order(item, t_off, e_off)
+                                writer.upsert(item_name, highest_price + 1)
+                                price_index[item_name] = highest_price + 1
+                                select_quality(0)
+                                struct.PRICE_INPUT.paste_insert(str(highest_price + 1), offset=(100, 0))
+                                struct.CREATE_BUY_ORDER.click()
+                                struct.CONFIRM_BUY_ORDER.click()
+                        struct.CLOSE_BUY_ORDER.click()
+                        current_quality = None
+                writer.checkpoint()
+    finally:
+        df = writer.close()
+    return df
+
 
-df.to_excel("fort_sterling_orders.xlsx", index=False)
+def export_orders(df, path=LEGACY_ORDERS_FILE):
+    """Writes a human readable copy of the orders as an xlsx sheet."""
+    df.to_excel(path, index=False, engine="xlsxwriter")
 
 
 def main():
-    print("Hello from albion-auto-orders!")
+    parser = ArgumentParser(description="Albion Online buy orders bot.")
+    parser.add_argument(
+        "--export-xlsx",
+        action="store_true",
+        help=f"also write the orders to {LEGACY_ORDERS_FILE} when done"
+    )
+    args = parser.parse_args()
+    df = _run(load_orders(), get_structure())
+    if args.export_xlsx:
+        export_orders(df)
 
 
 if __name__ == "__main__":
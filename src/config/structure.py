@@ -1,55 +1,100 @@
 """Element Definitions"""
 
+from functools import cached_property
 from pathlib import Path
 
 from src.packages import Element
 from src.packages import ImageManager
 
 class Structure:
-    """ Structure class. """
+    """ Structure class, elements are built on first access. """
 
     CWD_PATH = Path(__file__).parent.parent.parent.resolve()
 
-    img_manager = ImageManager(CWD_PATH.joinpath("images"))
+    @cached_property
+    def img_manager(self) -> ImageManager:
+        return ImageManager(self.CWD_PATH.joinpath("images"))
 
-    ORDERS = Element("orders", img_manager, (1387, 495))
+    @cached_property
+    def ORDERS(self) -> Element:
+        return Element("orders", self.img_manager, (1387, 495))
 
-    SEARCH = Element("search", img_manager, (592, 270))
+    @cached_property
+    def SEARCH(self) -> Element:
+        return Element("search", self.img_manager, (592, 270))
 
-    CATEGORY = Element("category", img_manager, (766, 270))
+    @cached_property
+    def CATEGORY(self) -> Element:
+        return Element("category", self.img_manager, (766, 270))
 
-    TIER = Element("tier", img_manager, (938, 270))
+    @cached_property
+    def TIER(self) -> Element:
+        return Element("tier", self.img_manager, (938, 270))
 
-    ENCHANTMENT = Element("enchantment", img_manager, (1110, 270))
+    @cached_property
+    def ENCHANTMENT(self) -> Element:
+        return Element("enchantment", self.img_manager, (1110, 270))
 
-    CLOSE_MARKET = Element("close_market", img_manager, (1350, 180))
+    @cached_property
+    def CLOSE_MARKET(self) -> Element:
+        return Element("close_market", self.img_manager, (1350, 180))
 
-    BUY_ORDER_BUTTON = Element("buy_order_button", img_manager, (1270, 434))
+    @cached_property
+    def BUY_ORDER_BUTTON(self) -> Element:
+        return Element("buy_order_button", self.img_manager, (1270, 434))
 
-    CLOSE_BUY_ORDER = Element("close_buy_order", img_manager, (936, 306))
+    @cached_property
+    def CLOSE_BUY_ORDER(self) -> Element:
+        return Element("close_buy_order", self.img_manager, (936, 306))
 
-    CREATE_BUY_ORDER = Element("create_buy_order", img_manager, (880, 727))
+    @cached_property
+    def CREATE_BUY_ORDER(self) -> Element:
+        return Element("create_buy_order", self.img_manager, (880, 727))
 
-    PRICE_INPUT = Element("price", img_manager, (513, 630))  # (640, 630)
+    @cached_property
+    def PRICE_INPUT(self) -> Element:
+        return Element("price", self.img_manager, (513, 630))  # (640, 630)
 
-    QUALITY_SELECTOR = Element("quality", img_manager, (826, 396)) # first 28 to - 27
+    @cached_property
+    def QUALITY_SELECTOR(self) -> Element:
+        return Element("quality", self.img_manager, (826, 396)) # first 28 to - 27
 
-    CONFIRM_BUY_ORDER = Element("confirm_buy_order", img_manager, (857, 556))
+    @cached_property
+    def CONFIRM_BUY_ORDER(self) -> Element:
+        return Element("confirm_buy_order", self.img_manager, (857, 556))
 
-    REGISTERED_ORDERS = Element("registered_orders", img_manager, (1384, 582))
+    @cached_property
+    def REGISTERED_ORDERS(self) -> Element:
+        return Element("registered_orders", self.img_manager, (1384, 582))
 
-    REMOVE_OLD_ORDER = Element("remove_old_order", img_manager, (1317, 410))
+    @cached_property
+    def REMOVE_OLD_ORDER(self) -> Element:
+        return Element("remove_old_order", self.img_manager, (1317, 410))
 
-    BOUGHT_ORDERS = Element("bought_orders", img_manager, (1384, 740))
+    @cached_property
+    def BOUGHT_ORDERS(self) -> Element:
+        return Element("bought_orders", self.img_manager, (1384, 740))
 
-    TAKE_ITEM = Element("take_item", img_manager, (1270, 427))
+    @cached_property
+    def TAKE_ITEM(self) -> Element:
+        return Element("take_item", self.img_manager, (1270, 427))
 
-    MATERIALS = Element("materials", img_manager, (783, 622))
+    @cached_property
+    def MATERIALS(self) -> Element:
+        return Element("materials", self.img_manager, (783, 622))
 
-    RUNE = Element("rune", img_manager, (950, 753))
+    @cached_property
+    def RUNE(self) -> Element:
+        return Element("rune", self.img_manager, (950, 753))
 
-    SOUL = Element("soul", img_manager, (950, 783))
+    @cached_property
+    def SOUL(self) -> Element:
+        return Element("soul", self.img_manager, (950, 783))
 
-    ITEM_NUMBER = Element("item_number", img_manager, (576, 572))
+    @cached_property
+    def ITEM_NUMBER(self) -> Element:
+        return Element("item_number", self.img_manager, (576, 572))
 
-    ADD_ITEM_SILVER = Element("add_item_silver", img_manager, (860, 628))
\ No newline at end of file
+    @cached_property
+    def ADD_ITEM_SILVER(self) -> Element:
+        return Element("add_item_silver", self.img_manager, (860, 628))
@@ -0,0 +1,145 @@
+""" Orders Writer Module """
+
+from logging import getLogger
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Thread
+
+from pandas import DataFrame, Index, concat
+
+logger = getLogger("order_writer")
+
+
+class OrderWriter:
+    """
+    Background thread that owns the orders DataFrame. The GUI loop only
+    queues the prices it set and carries on clicking, while the writer
+    applies them and checkpoints the orders file in between. Orders are
+    indexed by a categorical `Item`, so upserts are label lookups.
+
+    Example usage:
+        >>> writer = OrderWriter(df, Path("orders.parquet"))
+        >>> writer.upsert("cowl 4 1", 15001)
+        >>> writer.checkpoint()
+        >>> df = writer.close()
+    """
+
+    def __init__(
+        self,
+        df: DataFrame,
+        path: Path,
+        checkpoint_interval: float = 30
+    ) -> None:
+        """
+        Initializes an OrderWriter instance and starts its thread.
+
+        Args:
+            df (DataFrame): The loaded orders, with `Item` and `Price`.
+            path (Path): The parquet file written on every checkpoint.
+            checkpoint_interval (float): Seconds without new records after
+                which pending changes are written. Defaults to 30.
+        """
+        self.df = df.astype({"Item": "category"}).set_index("Item")
+        self.path = Path(path)
+        self.checkpoint_interval = checkpoint_interval
+        self._new_rows: dict[str, int] = {}
+        self._updates: dict[str, int] = {}
+        self._dirty = False
+        self._error: Exception | None = None
+        self._queue = Queue()
+        self._thread = Thread(target=self._writer_loop, daemon=True)
+        self._thread.start()
+
+    def upsert(self, item_name: str, price: int) -> None:
+        """
+        Queues the price of an item, adding the item if it is new.
+
+        Args:
+            item_name (str): Item name as stored in the orders file.
+            price (int): The price the buy order was placed at.
+        """
+        self._queue.put(("upsert", item_name, price))
+
+    def checkpoint(self) -> None:
+        """Queues a write of the orders file."""
+        self._queue.put(("checkpoint", None, None))
+
+    def close(self) -> DataFrame:
+        """
+        Writes the pending changes and stops the thread.
+
+        Returns:
+            DataFrame: The updated orders, with `Item` back as a column.
+
+        Raises:
+            Exception: The error of the last write, if the orders file could
+                not be written with every change.
+        """
+        self._queue.put(("stop", None, None))
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self.df.reset_index()
+
+    def _writer_loop(self) -> None:
+        while True:
+            try:
+                op, item_name, price = self._queue.get(
+                    timeout=self.checkpoint_interval
+                )
+            except Empty:
+                self._flush()
+                continue
+            if op == "upsert":
+                self._stage(item_name, price)
+            elif op == "checkpoint":
+                self._flush()
+            elif op == "stop":
+                self._flush()
+                return
+
+    def _stage(self, item_name: str, price: int) -> None:
+        if item_name in self.df.index:
+            self._updates[item_name] = price
+        else:
+            self._new_rows[item_name] = price
+
+    def _flush(self) -> None:
+        """
+        Applies the staged rows and prices and writes the orders file. A
+        failed write is logged and kept pending, so the next flush retries
+        it instead of the thread dying with the changes.
+        """
+        try:
+            self._apply()
+            if not self._dirty:
+                return
+            self.df.reset_index().to_parquet(
+                self.path, engine="pyarrow", index=False
+            )
+        except Exception as error:
+            logger.exception("Could not write the orders to %s", self.path)
+            self._error = error
+            return
+        self._dirty = False
+        self._error = None
+        logger.debug("Orders checkpointed to %s", self.path)
+
+    def _apply(self) -> None:
+        """Applies the staged rows and prices to the orders DataFrame."""
+        if self._new_rows:
+            new_rows = DataFrame(
+                {"Price": list(self._new_rows.values())},
+                index=Index(list(self._new_rows), name="Item")
+            )
+            df = concat([self.df, new_rows])
+            df.index = df.index.astype("category")
+            self.df = df
+            self._new_rows.clear()
+            self._dirty = True
+        if self._updates:
+            self.df.loc[list(self._updates), "Price"] = list(
+                self._updates.values()
+            )
+            self._updates.clear()
+            self._dirty = True
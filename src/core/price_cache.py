@@ -0,0 +1,98 @@
+""" Market Price Cache Module """
+
+import atexit
+import json
+from logging import getLogger
+from pathlib import Path
+from time import time
+
+logger = getLogger("price_cache")
+
+
+class PriceCache:
+    """
+    Disk backed cache of market prices read from the buy order window,
+    keyed by item name and quality. Entries older than `ttl` seconds are
+    treated as missing, so reruns only skip reads that are still fresh.
+
+    Example usage:
+        >>> cache = PriceCache("price_cache.json", ttl=60)
+        >>> cache.set("cowl 4 1", 0, 15000)
+        >>> cache.get("cowl 4 1", 0)
+        ... 15000
+    """
+
+    def __init__(self, path: str | Path, ttl: float = 60) -> None:
+        """
+        Initializes a PriceCache instance and schedules it to be flushed
+        to disk when the interpreter exits.
+
+        Args:
+            path (str | Path): JSON file backing the cache.
+            ttl (float): Seconds a cached price stays valid. Defaults to 60.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries: dict[str, list] = self._load()
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _key(item_name: str, quality: int) -> str:
+        return f"{item_name} {quality}"
+
+    def _load(self) -> dict:
+        """
+        Loads the cached entries from disk.
+
+        Returns:
+            dict: Mapping of key to [price, timestamp], empty if the file
+                does not exist or cannot be parsed.
+        """
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("Could not read price cache %s", self.path)
+            return {}
+
+    def get(self, item_name: str, quality: int) -> int | None:
+        """
+        Gets a cached price if it is still fresh.
+
+        Args:
+            item_name (str): Item name as stored in the orders sheet.
+            quality (int): Quality index in the quality selector.
+
+        Returns:
+            int | None: The cached price, None if missing or expired.
+        """
+        entry = self._entries.get(self._key(item_name, quality))
+        if entry is None:
+            return None
+        price, timestamp = entry
+        if time() - timestamp >= self.ttl:
+            return None
+        return price
+
+    def set(self, item_name: str, quality: int, price: int) -> None:
+        """
+        Stores a freshly read price.
+
+        Args:
+            item_name (str): Item name as stored in the orders sheet.
+            quality (int): Quality index in the quality selector.
+            price (int): Price read from the market.
+        """
+        self._entries[self._key(item_name, quality)] = [price, time()]
+
+    def flush(self) -> None:
+        """Writes the fresh entries to disk, dropping the expired ones."""
+        now = time()
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if now - entry[1] < self.ttl
+        }
+        self.path.write_text(json.dumps(self._entries), encoding="utf-8")
+        logger.debug("Flushed %s cached prices", len(self._entries))
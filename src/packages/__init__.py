@@ -1,6 +1,24 @@
-from src.packages.element import Element
-from src.packages.image_manager import ImageManager
+from importlib import import_module
 
-__all__ = ["Element", "ImageManager"]
+_EXPORTS = {
+    "Element": "src.packages.element",
+    "ImageManager": "src.packages.image_manager",
+    "fast_copy": "src.packages.clipboard",
+    "fast_paste": "src.packages.clipboard",
+    "fast_paste_keys": "src.packages.clipboard",
+}
+
+__all__ = [
+    "Element", "ImageManager", "fast_copy", "fast_paste", "fast_paste_keys"
+]
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name):
+    """Imports the subpackage of an export on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,7 @@
+from src.packages.clipboard.clipboard import (
+    fast_copy,
+    fast_paste,
+    fast_paste_keys
+)
+
+__all__ = ["fast_copy", "fast_paste", "fast_paste_keys"]
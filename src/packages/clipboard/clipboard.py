@@ -0,0 +1,184 @@
+""" Clipboard Module """
+
+import ctypes
+from logging import getLogger
+from sys import platform
+from time import monotonic, sleep
+
+import pyperclip
+
+logger = getLogger("clipboard")
+
+CF_UNICODETEXT = 13
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_C = 0x43
+VK_V = 0x56
+COPY_TIMEOUT = 0.5
+COPY_POLL_INTERVAL = 0.005
+FALLBACK_SETTLE_TIME = 0.1
+
+
+class KEYBDINPUT(ctypes.Structure):
+    """ Win32 KEYBDINPUT structure. """
+
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    """ Win32 MOUSEINPUT structure, only needed to size the INPUT union. """
+
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    """ Win32 INPUT structure. """
+
+    _fields_ = [("type", ctypes.c_ulong), ("union", _INPUTUNION)]
+
+
+if platform == "win32":
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+    user32.SendInput.argtypes = [
+        ctypes.c_uint, ctypes.POINTER(INPUT), ctypes.c_int
+    ]
+    user32.GetClipboardData.restype = ctypes.c_void_p
+    user32.GetClipboardSequenceNumber.restype = ctypes.c_ulong
+    kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+
+
+def fast_paste() -> str:
+    """
+    Reads the clipboard text straight from the Win32 API, skipping the
+    pyperclip backend lookup on every call. Other platforms fall back to
+    pyperclip.
+
+    Returns:
+        str: The clipboard text, empty if there is no text on it.
+    """
+    if platform != "win32":
+        return pyperclip.paste()
+    if not user32.OpenClipboard(0):
+        logger.debug("Clipboard is locked by another window")
+        return ""
+    try:
+        handle = user32.GetClipboardData(CF_UNICODETEXT)
+        if not handle:
+            return ""
+        pointer = kernel32.GlobalLock(handle)
+        if not pointer:
+            return ""
+        try:
+            return ctypes.wstring_at(pointer)
+        finally:
+            kernel32.GlobalUnlock(handle)
+    finally:
+        user32.CloseClipboard()
+
+
+def _key_input(vk_code: int, flags: int = 0) -> INPUT:
+    """
+    Builds a keyboard INPUT record.
+
+    Args:
+        vk_code (int): Virtual-key code.
+        flags (int): KEYBDINPUT flags. Defaults to 0 (key down).
+
+    Returns:
+        INPUT: The keyboard input record.
+    """
+    return INPUT(
+        type=INPUT_KEYBOARD,
+        union=_INPUTUNION(ki=KEYBDINPUT(wVk=vk_code, dwFlags=flags))
+    )
+
+
+def _send_ctrl_chord(vk_code: int, fallback_key: str) -> bool:
+    """
+    Sends ctrl+<key> as a single SendInput batch (ctrl down, key down,
+    key up, ctrl up), avoiding the per-key pauses of pyautogui.hotkey.
+    Other platforms fall back to pyautogui.hotkey.
+
+    Args:
+        vk_code (int): Virtual-key code of the key pressed with ctrl.
+        fallback_key (str): pyautogui name of the same key.
+
+    Returns:
+        bool: True if every key event was injected, False otherwise.
+    """
+    if platform != "win32":
+        import pyautogui
+        pyautogui.hotkey("ctrl", fallback_key)
+        return True
+    inputs = (INPUT * 4)(
+        _key_input(VK_CONTROL),
+        _key_input(vk_code),
+        _key_input(vk_code, KEYEVENTF_KEYUP),
+        _key_input(VK_CONTROL, KEYEVENTF_KEYUP),
+    )
+    sent = user32.SendInput(len(inputs), inputs, ctypes.sizeof(INPUT))
+    if sent != len(inputs):
+        logger.warning("Only %s of %s key events sent", sent, len(inputs))
+        return False
+    return True
+
+
+def fast_copy(timeout: float = COPY_TIMEOUT) -> bool:
+    """
+    Sends ctrl+c in a single SendInput batch and waits for the focused
+    window to write the clipboard. SendInput returns as soon as the events
+    are queued, so the clipboard sequence number is polled until it changes.
+    Other platforms give the copy a short settle time instead.
+
+    Args:
+        timeout (float): Seconds to wait for the clipboard to change.
+
+    Returns:
+        bool: True if the clipboard was written, False if the key events
+        could not be sent or the clipboard did not change in time.
+    """
+    if platform != "win32":
+        _send_ctrl_chord(VK_C, "c")
+        sleep(FALLBACK_SETTLE_TIME)
+        return True
+    sequence = user32.GetClipboardSequenceNumber()
+    if not _send_ctrl_chord(VK_C, "c"):
+        return False
+    deadline = monotonic() + timeout
+    while user32.GetClipboardSequenceNumber() == sequence:
+        if monotonic() >= deadline:
+            logger.debug("Clipboard did not change within %ss", timeout)
+            return False
+        sleep(COPY_POLL_INTERVAL)
+    return True
+
+
+def fast_paste_keys() -> bool:
+    """
+    Sends ctrl+v in a single SendInput batch.
+
+    Returns:
+        bool: True if every key event was injected, False otherwise.
+    """
+    return _send_ctrl_chord(VK_V, "v")
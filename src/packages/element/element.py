@@ -1,16 +1,66 @@
 """ Generic Element Module """
 
+from collections import deque
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
-from time import sleep
+from sys import intern
+from time import monotonic, sleep
 from types import NoneType
-from typing import Union, Dict, List, Tuple
+from typing import TYPE_CHECKING, Union, Dict, List, Tuple
 
-import PIL.Image
-import pyautogui
+import numpy as np
+import pyperclip
+
+if TYPE_CHECKING:
+    import PIL.Image
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stands in for numba.njit when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
 
 logger = getLogger("element")
 
+_pyautogui = None
+
+
+def _gui():
+    """
+    Imports pyautogui on first use, as it probes the display backend on
+    import and the element tree can be built without it.
+
+    Returns:
+        module: The pyautogui module.
+    """
+    global _pyautogui
+    if _pyautogui is None:
+        import pyautogui
+        _pyautogui = pyautogui
+    return _pyautogui
+
+
+@njit(cache=True)
+def _apply_offsets(base_x, base_y, off_x, off_y, out_x, out_y):
+    """
+    Fills the absolute coordinates of a parent's children from their
+    offsets. JIT compiled when numba is available, plain numpy otherwise.
+
+    Args:
+        base_x (int | float): Parent X-axis coordinate.
+        base_y (int | float): Parent Y-axis coordinate.
+        off_x (numpy.ndarray): Children X-axis offsets.
+        off_y (numpy.ndarray): Children Y-axis offsets.
+        out_x (numpy.ndarray): Output X-axis coordinates.
+        out_y (numpy.ndarray): Output Y-axis coordinates.
+    """
+    out_x[:] = off_x + base_x
+    out_y[:] = off_y + base_y
+
 
 class Element:
     """
@@ -29,6 +79,18 @@ class Element:
         ... True
     """
 
+    __slots__ = (
+        'element', 'image_manager', 'parent', 'children', '_offsetx',
+        '_offsety', 'location', 'path_to_origin', '_image_element',
+        '_size_cache', '_valid', '_resolved_path', '_stem',
+        '_walk_path_reversed', '_last_located_at', '_last_located_conf',
+        '_child_order', '_other_children', '_child_offsets_x',
+        '_child_offsets_y', '_descendants', '_descendants_dirty',
+        '_apply_location'
+    )
+
+    _locate_ttl: float = 0.5
+
     def __init__(
         self,
         name: str | Path,
@@ -49,22 +111,45 @@ class Element:
             parent: object, The parent Element instance.
             children: object or dict[object] or list[object], Child elements.
         """
-        self.element = Path(name)
+        self.element = name if isinstance(name, Path) else Path(name)
+        self._stem = intern(self.element.stem)
         self.image_manager = image_manager
         self.parent = parent
         self.children = self._get_children(children)
+        self._rebuild_child_offsets()
         self._offsetx = location[0] if location is not None else 0
         self._offsety = location[1] if location is not None else 0
+        self._bind_location()
+        self.location = None
         self.location = self.set_location(location)
         self.path_to_origin = [self]
-        self.images = {}
-        self._name = self.name
-        self._image_element = self.image_element
-        self._width = self.width
-        self._height = self.height
+        self._walk_path_reversed = (self,)
+        self._last_located_at = 0.0
+        self._last_located_conf = 0.0
+        self._image_element = None
+        self._size_cache = None
+        self._resolved_path = self._check_element_path()
         self._valid = self._check_image_manager_instance()
         self.set_parent(parent)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _stem_index(folder_path: Path) -> dict[str, Path]:
+        """
+        Maps every file stem in a folder to its path, scanning the folder
+        only once per path.
+
+        Args:
+            folder_path (Path): The image folder.
+
+        Returns:
+            dict[str, Path]: The first file found for each stem.
+        """
+        index = {}
+        for path in folder_path.iterdir():
+            index.setdefault(path.stem, path)
+        return index
+
     def _check_element_path(self) -> bool | Path:
         """
         Check if the element path exists and returns it.
@@ -72,20 +157,14 @@ class Element:
         Returns:
             bool | Path: The element path if exists, False otherwise.
         """
-        if path := self.element.exists():
-            path = self.element
         if self.image_manager is not None:
-            path = [
-                path
-                for path in self.image_manager.folder_path.iterdir()
-                if path.stem == self.element.stem
-            ]
-            if len(path) == 0:
-                return None
-            return path[0]
-        if not path:
-            logger.debug('%s is not a valid image path', self.element)
-        return path
+            return self._stem_index(self.image_manager.folder_path).get(
+                self._stem
+            )
+        if self.element.exists():
+            return self.element
+        logger.debug('%s is not a valid image path', self.element)
+        return False
 
     def _check_image_manager_instance(self):
         """
@@ -95,7 +174,7 @@ class Element:
             bool: True if valid, False otherwise.
         """
         if self.image_manager is not None:
-            path = self._check_element_path()
+            path = self._resolved_path
             if path is None:
                 return False
             if self.image_manager.images_map.get(path.stem) is not None:
@@ -104,6 +183,21 @@ class Element:
             return False
         return False
 
+    def invalidate(self) -> bool:
+        """
+        Resolves the element image again, e.g. after images were added to
+        or removed from the Image Manager folder.
+
+        Returns:
+            bool: True if the element is valid after the refresh.
+        """
+        self._stem_index.cache_clear()
+        self._resolved_path = self._check_element_path()
+        self._image_element = None
+        self._size_cache = None
+        self._valid = self._check_image_manager_instance()
+        return self._valid
+
     @property
     def name(self) -> str:
         """
@@ -112,19 +206,41 @@ class Element:
         Returns:
             str : The name of the image element.
         """
-        return self.element.stem
+        return self._stem
 
     @property
-    def image_element(self) -> PIL.Image.Image:
+    def image_element(self) -> "PIL.Image.Image":
         """
-        Gets the PIL.Image object associated with the element.
+        Gets the PIL.Image object associated with the element, opened on
+        first access.
 
         Returns:
             PIL.Image: Image element.
         """
-        if path:= self._check_element_path():
-            return PIL.Image.open(path)
-        return path
+        if self._image_element is None:
+            if path := self._resolved_path:
+                import PIL.Image
+                self._image_element = PIL.Image.open(path)
+            else:
+                return path
+        return self._image_element
+
+    @property
+    def _size(self) -> Tuple[int, int]:
+        """
+        Reads the image size once, from the file header only, and closes
+        the file right away.
+
+        Returns:
+            Tuple[int, int]: (width, height), (0, 0) without an image.
+        """
+        if self._size_cache is None:
+            if not self._resolved_path:
+                return (0, 0)
+            import PIL.Image
+            with PIL.Image.open(self._resolved_path) as image:
+                self._size_cache = image.size
+        return self._size_cache
 
     @property
     def width(self) -> float:
@@ -134,9 +250,7 @@ class Element:
         Returns:
             int or float: The width of the image element.
         """
-        if self._image_element:
-            return self._image_element.size[0]
-        return 0
+        return self._size[0]
 
     @property
     def height(self) -> float:
@@ -146,22 +260,20 @@ class Element:
         Returns:
             int or float: The height of the image element.
         """
-        if self._image_element:
-            return self._image_element.size[1]
-        return 0
+        return self._size[1]
 
-    def visible(self, confidence: float=0.9, timeout: float=0.1) -> bool:
+    def visible(self, confidence: float=0.9, timeout: float=6) -> bool:
         """
         Checks if the image associated with the element is currently visible.
 
         Args:
             confidence (float): Confidence level for image localization.
-            timeout (float): Time interval to wait for the image.
+            timeout (float): Seconds to wait for the image. Defaults to 6.
         
         Returns:
             bool: True if visible, False otherwise.
         """
-        if self._check_image_manager_instance():
+        if self._valid:
             return self.image_manager.wait_image(
                 self.name,
                 confidence=confidence,
@@ -169,9 +281,78 @@ class Element:
             )
         return False
 
-    def _update_children_location(self):
-        for element in self.children.values():
+    def _rebuild_child_offsets(self) -> None:
+        """
+        Packs the offsets of the children parented to this element into
+        two contiguous arrays, so their locations are computed with one
+        vector add. Children parented elsewhere keep the per-child path.
+        """
+        self._child_order = []
+        self._other_children = []
+        for child in self.children.values():
+            if child.parent is self:
+                self._child_order.append(child)
+            else:
+                self._other_children.append(child)
+        self._child_offsets_x = np.array(
+            [child._offsetx for child in self._child_order]
+        )
+        self._child_offsets_y = np.array(
+            [child._offsety for child in self._child_order]
+        )
+        element = self
+        while element is not None:
+            element._descendants_dirty = True
+            element = element.parent
+
+    def _apply_children_location(self) -> None:
+        """Moves the children parented to this element, one level only."""
+        if self._child_order:
+            loc = self.location or (0, 0)
+            abs_x = np.empty(
+                len(self._child_order),
+                np.result_type(self._child_offsets_x, loc[0])
+            )
+            abs_y = np.empty(
+                len(self._child_order),
+                np.result_type(self._child_offsets_y, loc[1])
+            )
+            _apply_offsets(
+                loc[0], loc[1],
+                self._child_offsets_x, self._child_offsets_y,
+                abs_x, abs_y
+            )
+            for child, x, y in zip(
+                self._child_order, abs_x.tolist(), abs_y.tolist()
+            ):
+                child.location = (x, y)
+        for element in self._other_children:
             element.set_location()
+
+    def _flat_descendants(self) -> List[object]:
+        """
+        Gets the descendants parented through this element in breadth
+        first order, so every parent comes before its children. The list
+        is cached until the tree below this element changes.
+
+        Returns:
+            List[Element]: The descendants, without the element itself.
+        """
+        if self._descendants_dirty:
+            descendants = []
+            queue = deque(self._child_order)
+            while queue:
+                element = queue.popleft()
+                descendants.append(element)
+                queue.extend(element._child_order)
+            self._descendants = descendants
+            self._descendants_dirty = False
+        return self._descendants
+
+    def _update_children_location(self):
+        self._apply_children_location()
+        for element in self._flat_descendants():
+            element._apply_children_location()
         logger.debug("Childrens location updated!")
 
     def set_location(
@@ -191,46 +372,65 @@ class Element:
         Returns:
             tuple | bool: Tuple of coordinates or boolean.
         """
-        if all(value is None for value in [location, x, y, self.parent]):
-            self._update_children_location()
-            return location
+        return self._apply_location(self, location, x, y)
+
+    def _bind_location(self) -> None:
+        """
+        Picks the set_location variant matching the parent and the offset
+        of the element, so the choice is not repeated on every call. Has to
+        run again whenever the parent changes.
+        """
         if self.parent is None:
-            self._update_children_location()
-            return location or (0, 0)
-        loc = self.parent.location or (0, 0)
-        if location:
-            self.location = (loc[0]+location[0], loc[1]+location[1])
-            self._update_children_location()
-            return self.location
-        if x is not None and y is not None:
-            self.location = (loc[0]+x, loc[1]+y)
-            self._update_children_location()
+            self._apply_location = _apply_no_parent
+        elif self._offsetx or self._offsety:
+            self._apply_location = _apply_own_offset
+        else:
+            self._apply_location = _apply_absolute
+
+    def _relocate(self, location: tuple) -> tuple:
+        """
+        Moves the element and its subtree, unless it is already there and
+        no child was added or removed since the last sweep.
+
+        Args:
+            location (tuple): New coordinates (x, y).
+
+        Returns:
+            tuple: The element location.
+        """
+        if location == self.location and not self._descendants_dirty:
             return self.location
-        self.location = (loc[0] + self._offsetx, loc[1] + self._offsety)
+        self.location = location
         self._update_children_location()
         return self.location
 
     def set_walk_path(self, element: object) -> None:
         """ 
-        Retrieves the element walk path recursively. 
+        Retrieves the element walk path, walking up the parents chain.
 
         Args:
             element (object): The element for which to retrieve the walk path.
         """
-        if isinstance(element, Element):
-            if element.parent is not None:
-                self.path_to_origin.append(element.parent)
-                self.set_walk_path(element.parent)
+        self.path_to_origin = [self]
+        current = element
+        while isinstance(current, Element) and current.parent is not None:
+            self.path_to_origin.append(current.parent)
+            current = current.parent
+        self._walk_path_reversed = tuple(
+            element
+            for element in reversed(self.path_to_origin)
+            if element is not None
+        )
 
-    def wait_till_visible(self, timeout: float | None = 10) -> bool:
+    def wait_till_visible(self, timeout: float | None = 600) -> bool:
         """
         Checks if the image associated with the element is visible
         and waits until it is visible if timeout is set as None.
 
         Args:
             timeout : (float | None, optional)
-            Time interval to wait for the image to be visible. If set to None,
-            it waits indefinitely until the image is visible. (default is 10)
+            Seconds to wait for the image to be visible. If set to None,
+            it waits indefinitely until the image is visible. (default is 600)
 
         Returns:
             bool, True if the image is visible, False otherwise.
@@ -256,7 +456,9 @@ class Element:
             confidence (float): Confidence level for image localization.
                 Defaults to 0.85.
             image (bool): If False, will search for the image again,
-                else use the last location. Defaults to False.
+                else use the last location. Defaults to False. A search
+                that succeeded less than `_locate_ttl` seconds ago at an
+                equal or higher confidence is reused.
 
         Returns:
             bool: True if the image is located, None otherwise.
@@ -264,10 +466,19 @@ class Element:
         if not is_image:
             if self.location is not None:
                 return self.location
+        if (
+            self.location is not None
+            and monotonic() - self._last_located_at < self._locate_ttl
+            and confidence <= self._last_located_conf
+        ):
+            return self.location
         if self._valid:
             self.location = self.image_manager.locate_image(
                 self.name, confidence
             )
+            if self.location is not None:
+                self._last_located_at = monotonic()
+                self._last_located_conf = confidence
             self._update_children_location()
             return self.location
         logger.error(
@@ -289,21 +500,43 @@ class Element:
         Returns:
             dict: Dictionary containing child elements mapped by their names.
         """
-        match children:
-            case c if isinstance(c, dict):
-                pass
-            case c if isinstance(c, list):
-                for child in children:
-                    child.parent = self
-                children = {child.image.stem: child for child in children}
-            case c if isinstance(c, Element):
-                children.parent = self
-                children = {children.image.stem: children}
-            case c if isinstance(c, NoneType):
-                children = {}
-            case _:
-                raise ValueError(f'{type(children)} is not valid for child.')
-        return children
+        handler = _CHILD_HANDLERS.get(type(children))
+        if handler is not None:
+            return handler(self, children)
+        if isinstance(children, Element):
+            return self._from_element(children)
+        raise ValueError(f'{type(children)} is not valid for child.')
+
+    def _from_list(self, children: List[object]) -> dict:
+        """
+        Adopts a list of child elements.
+
+        Args:
+            children (List[Element]): Child elements.
+
+        Returns:
+            dict: Dictionary containing child elements mapped by their names.
+        """
+        result = {}
+        for child in children:
+            child.parent = self
+            child._bind_location()
+            result[child._stem] = child
+        return result
+
+    def _from_element(self, child: object) -> dict:
+        """
+        Adopts a single child element.
+
+        Args:
+            child (Element): Child element.
+
+        Returns:
+            dict: Dictionary containing the child mapped by its name.
+        """
+        child.parent = self
+        child._bind_location()
+        return {child._stem: child}
 
     def set_parent(self, parent: object) -> object:
         """ 
@@ -317,7 +550,9 @@ class Element:
         """
         if self.parent is not None:
             self.parent = parent
-            parent.children.update({self.element.stem: self})
+            self._bind_location()
+            parent.children.update({self._stem: self})
+            parent._rebuild_child_offsets()
             self.set_walk_path(self)
         return self.parent
 
@@ -335,6 +570,7 @@ class Element:
             dict: Dictionary containing the set child elements.
         """
         self.children = self._get_children(children)
+        self._rebuild_child_offsets()
         return self.children
 
     def add_child(
@@ -363,6 +599,7 @@ class Element:
                 continue
             self.children[name] = child
             logger.info("Child added: %s", child)
+        self._rebuild_child_offsets()
         return self.children
 
     def remove_child(
@@ -384,6 +621,7 @@ class Element:
             if self.children.get(child) is not None:
                 self.children.pop(child)
                 logger.info("Child removed: %s", child)
+        self._rebuild_child_offsets()
         return self.children
 
     def update_child(self, child: object):
@@ -396,35 +634,41 @@ class Element:
         Returns:
             bool: True if the child was successfully updated, False otherwise.
         """
-        if self.children.get(child) is not None:
+        if self.children.get(child._stem) is not None:
             child.parent = self
-            self.children[child.element.name] = child
+            child._bind_location()
+            self.children[child._stem] = child
+            self._rebuild_child_offsets()
             return True
         return False
 
     def _click_coordinates(
         self,
-        button: str = pyautogui.LEFT,
+        button: str = "left",
         offset: tuple = (0, 0),
         times: int = 1,
+        duration: float = 0.0,
     ) -> bool:
         """ 
         Clicks on the coordinates of the element.
 
         Args:
-            button (str): Mouse button to click. Defaults to pyautogui.LEFT.
+            button (str): Mouse button to click. Defaults to "left".
             offset (tuple): Offset coordinates for the click. Defaults to (0, 0).
             times (int): Number of clicks. Defaults to 1.
+            duration (float): Seconds the cursor takes to move to the
+                element. Defaults to 0.0 (jump straight to it).
 
         Returns:
             bool: True if the click was successful, False otherwise.
         """
         if self.location is None:
             return False
+        pyautogui = _gui()
         pyautogui.moveTo(
             self.location[0] + offset[0],
             self.location[1] + offset[1],
-            duration=0.1
+            duration=duration
         )
         pyautogui.click(button=button, clicks=times)
         return True
@@ -433,7 +677,7 @@ class Element:
         self,
         offset: tuple = (0, 0),
         confidence: float = 0.9,
-        button: str = pyautogui.LEFT,
+        button: str = "left",
         times: int = 1
     ) -> bool:
         """ 
@@ -445,7 +689,7 @@ class Element:
             confidence (float, optional): Confidence level image localization.
                 Defaults to 0.9.
             button (str, optional): Mouse button to click.
-                Defaults to pyautogui.LEFT.
+                Defaults to "left".
             times (int, optional): Number of clicks.
                 Defaults to 1.
 
@@ -465,13 +709,15 @@ class Element:
             logger.error("%s is not visible and clickable", self.element)
         return False
 
-    def move_to(self, location: tuple = None) -> bool:
+    def move_to(self, location: tuple = None, duration: float = 0.0) -> bool:
         """ 
         Moves the cursor to the specified location or element.
 
         Args:
             location (tuple, optional): Coords (x, y) to move the cursor to.
                 Defaults to None.
+            duration (float, optional): Seconds the cursor takes to move.
+                Defaults to 0.0.
 
         Returns:
             bool: True if the cursor moved successfully, False otherwise.
@@ -479,7 +725,7 @@ class Element:
         if location is None:
             location = self.location
         if isinstance(location, tuple):
-            pyautogui.moveTo(location[0], location[1], duration=0.1)
+            _gui().moveTo(location[0], location[1], duration=duration)
             return True
         logger.error("location provided: %s is not a tuple.", location)
         return False
@@ -488,12 +734,14 @@ class Element:
         self,
         offset: Tuple = (0, 0),
         confidence: float = 0.9,
-        button: str = pyautogui.LEFT,
+        button: str = "left",
         times: int = 1,
         timeout: int | float = 0.3,
         walk: bool = False,
         through: str = 'coordinates',
-        fail_safe: bool = False
+        fail_safe: bool = False,
+        duration: float = 0.0,
+        wait: bool = True
     ) -> bool:
         """ 
         Performs a click action on the element or its parents in the walk path.
@@ -502,33 +750,48 @@ class Element:
             offset (Tuple): Offset coordinates to click to. Defaults to (0, 0).
             confidence (float): Confidence level for image localization.
                 Defaults to 0.9.
-            button (str): Mouse button to click. Defaults to pyautogui.LEFT.
+            button (str): Mouse button to click. Defaults to "left".
             times (int): Number of clicks. Defaults to 1.
-            timeout (int | float): Waiting timeout before click the element.
-                Defaults to 1.
+            timeout (int | float): Seconds to wait before the click.
+                Defaults to 0.3.
             walk (bool): If True, clicks on all elements in the walk path.
                 Defaults to False.
             through (str): Method to click, either 'coordinates' or 'image'.
                 Defaults to 'coordinates'.
+            duration (float): Seconds the cursor takes to move to the
+                element. Defaults to 0.0.
+            wait (bool): If True, stops waiting as soon as the element
+                image is visible. Clicks with an offset and elements without
+                an image always sleep the whole timeout, as what they click
+                is not what the image shows, and so do walk clicks, once
+                before the walk path, as the image only shows up after its
+                parents open. If False, sleeps the whole timeout too, for
+                clicks that have to wait for an animation. Defaults to True.
 
         Returns:
             bool: True if the click was successful, False otherwise.
         """
-        pyautogui.FAILSAFE = fail_safe
+        _gui().FAILSAFE = fail_safe
         if walk:
-            for element in reversed(self.path_to_origin):
-                if element is None:
-                    continue
+            sleep(timeout)
+            for element in self._walk_path_reversed:
                 element.click(
                     confidence=confidence,
-                    timeout=timeout,
+                    timeout=0,
                     walk=False,
-                    through=through
+                    through=through,
+                    duration=duration,
+                    wait=False
                 )
             return True
-        sleep(timeout)
+        if wait and self._valid and offset == (0, 0):
+            self.image_manager.wait_till_visible(
+                self.name, timeout, confidence
+            )
+        else:
+            sleep(timeout)
         if through == 'coordinates':
-            clicked = self._click_coordinates(button, offset, times)
+            clicked = self._click_coordinates(button, offset, times, duration)
             if not clicked:
                 return self._click_image(offset, confidence, button, times)
             return clicked
@@ -560,9 +823,94 @@ class Element:
             None
         """
         self.click(offset=offset, through=through)
+        pyautogui = _gui()
         if clear:
-            pyautogui.hotkey("ctrl", "a")
+            with pyautogui.hold("ctrl"):
+                pyautogui.press("a")
         text = text.as_posix() if isinstance(text, Path) else text
         pyautogui.write(message=text, interval=interval)
         if enter:
             pyautogui.press('enter')
+
+    def paste_insert(
+        self,
+        text: str,
+        enter: bool = False,
+        offset: Tuple = (0, 0),
+        through: str = "coordinates",
+        clear: bool = True,
+        min_length: int = 3
+    ) -> None:
+        """
+        Performs a text insert into the element by pasting it from the
+        clipboard, one ctrl+v instead of a keystroke per letter. Texts
+        shorter than `min_length` are typed with `insert` instead, as it is
+        not worth replacing the clipboard content for them.
+
+        Args:
+            text (str): text to insert in the text box clicked.
+            enter (bool): if True press the `enter` hotkey otherwise nothing.
+            offset (Tuple): Offset coordinates to click to. Defaults to (0, 0).
+            through (str): Method to click, either 'coordinates' or 'image'.
+            clear (bool): if True select the current text to replace it.
+            min_length (int): Shortest text to paste. Defaults to 3.
+
+        Returns:
+            None
+        """
+        text = text.as_posix() if isinstance(text, Path) else text
+        if len(text) < min_length:
+            self.insert(
+                text, enter=enter, offset=offset, through=through, clear=clear
+            )
+            return
+        from src.packages.clipboard import fast_paste_keys
+        self.click(offset=offset, through=through)
+        pyautogui = _gui()
+        if clear:
+            with pyautogui.hold("ctrl"):
+                pyautogui.press("a")
+        pyperclip.copy(text)
+        fast_paste_keys()
+        if enter:
+            pyautogui.press('enter')
+
+
+def _apply_no_parent(element, location, x, y):
+    """set_location of a root element, it only moves the children."""
+    element._update_children_location()
+    if location is None and x is None and y is None:
+        return location
+    return location or (0, 0)
+
+
+def _apply_explicit_xy(element, location, x, y):
+    """set_location of a parented element given a location or x and y."""
+    loc = element.parent.location or (0, 0)
+    if location:
+        return element._relocate((loc[0]+location[0], loc[1]+location[1]))
+    return element._relocate((loc[0]+x, loc[1]+y))
+
+
+def _apply_own_offset(element, location, x, y):
+    """set_location of a parented element placed by its own offset."""
+    if location or (x is not None and y is not None):
+        return _apply_explicit_xy(element, location, x, y)
+    loc = element.parent.location or (0, 0)
+    return element._relocate(
+        (loc[0] + element._offsetx, loc[1] + element._offsety)
+    )
+
+
+def _apply_absolute(element, location, x, y):
+    """set_location of a parented element without offset from it."""
+    if location or (x is not None and y is not None):
+        return _apply_explicit_xy(element, location, x, y)
+    return element._relocate(element.parent.location or (0, 0))
+
+
+_CHILD_HANDLERS = {
+    dict: lambda element, children: children,
+    list: Element._from_list,
+    NoneType: lambda element, children: {},
+}
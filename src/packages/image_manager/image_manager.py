@@ -1,26 +1,124 @@
 """ Image ImageManager Module """
 
-from datetime import datetime, timedelta
+import atexit
+import json
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
 from logging import getLogger
-from os import mkdir
+from os import cpu_count, mkdir
 from pathlib import Path
-from time import sleep
-from typing import Tuple
+from time import monotonic, sleep
+from typing import List, Tuple
 from sys import platform
 
 import cv2
+import mss
+import numpy as np
 import pyautogui
 import pytesseract as pyt
 
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 logger = getLogger("image_manager")
 
+pyautogui.PAUSE = 0
+
+_PYRAMID_LEVELS = 2
+_PYRAMID_MIN_SIZE = 64
+_OCR_CACHE_SIZE = 64
+_MATCH_BANDS = 4
+_ROI_SUFFIX = ".roi.json"
+_CACHE_DIR = ".template_cache"
+_PSM_PATTERN = re.compile(r"--psm\s+(\d+)")
+
+
+@lru_cache(maxsize=None)
+def _read_image(photo_path: Path):
+    """
+    Decodes an image file once per path, so every ImageManager built over
+    the same folder shares the decoded buffers.
+
+    Args:
+        photo_path (Path): The image file path.
+
+    Returns:
+        numpy.ndarray | None: The BGR image, None if it cannot be decoded.
+    """
+    return cv2.imread(str(photo_path), cv2.IMREAD_COLOR)
+
+
+def _pyramid_down(image, levels: int = _PYRAMID_LEVELS):
+    """
+    Downsamples an image through a Gaussian pyramid.
+
+    Args:
+        image (numpy.ndarray): The image to downsample.
+        levels (int): Number of cv2.pyrDown steps, each halving the size.
+
+    Returns:
+        numpy.ndarray: The image at the requested pyramid level.
+    """
+    for _ in range(levels):
+        image = cv2.pyrDown(image)
+    return image
+
+
+def _match_in_bands(
+    screen,
+    template,
+    confidence: float,
+    bands: int = _MATCH_BANDS
+) -> tuple:
+    """
+    Matches a template band by band from the top of the screen, stopping at
+    the first band with a score above the confidence, so the rest of the
+    screen is not correlated once the image is found. Bands overlap by the
+    template height, so no position is missed.
+
+    Args:
+        screen (numpy.ndarray): The grayscale screen.
+        template (numpy.ndarray): The grayscale template.
+        confidence (float): The score that ends the search.
+        bands (int): Number of horizontal bands.
+
+    Returns:
+        tuple: (score, (x, y)) of the first match above the confidence, or
+            of the best match when there is none.
+    """
+    height = template.shape[0]
+    positions = screen.shape[0] - height + 1
+    step = max(-(-positions // bands), 1)
+    best = (-1.0, (0, 0))
+    for top in range(0, positions, step):
+        result = cv2.matchTemplate(
+            screen[top:top + step + height - 1],
+            template,
+            cv2.TM_CCOEFF_NORMED
+        )
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val > best[0]:
+            best = (max_val, (max_loc[0], top + max_loc[1]))
+            if max_val >= confidence:
+                break
+    return best
+
+
 class ImageManager():
     """A class to select and interact with images on the screen."""
 
+    _tess_version_checked: str | None = None
+
     def __init__(
         self,
         folder_path: str,
-        tesseract_path: str = None
+        tesseract_path: str = None,
+        use_opencl: bool = False
     ) -> None:
         """
         Initialize the ImageManager.
@@ -28,18 +126,40 @@ class ImageManager():
         Args:
             image_folder_name (str): The name of the folder containing images.
             tesseract_path (str): The tesseract exe path.
+            use_opencl (bool): If True and an OpenCL device is available,
+                matches on it instead of the CPU path, which skips the
+                pyramid, the ROI and the bands. Only worth it once
+                benchmarked on the target machine. Defaults to False.
         """
         self.config_tesseract(tesseract_path)
+        self._tess_api = None
+        self._tess_opened = False
         self.folder_path = Path(folder_path)
         if not self.folder_path.is_dir():
             mkdir(self.folder_path)
             logger.info("%s created. Fill it with images!", folder_path)
         self.images_map: dict = {}
+        self.images_gray: dict = {}
+        self.images_coarse: dict = {}
+        self._rois: dict = {}
+        self._templates_umat: dict = {}
+        self._use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        self._sct = None
+        self._monitor = None
+        self._last_screen = None
+        self._last_matches: dict = {}
+        self._ocr_cache: OrderedDict = OrderedDict()
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(4, cpu_count() or 1)
+        )
         self.load_images()
 
     def config_tesseract(self, tesseract_path: str = None) -> None:
         """
-        Configure pytesseract.
+        Configure pytesseract. The executable is only checked once per path
+        across all the instances, as the check spawns tesseract.
         
         """
         if tesseract_path:
@@ -50,24 +170,442 @@ class ImageManager():
             elif platform == "win32":
                 path_exe = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
             pyt.pytesseract.tesseract_cmd = path_exe
+        tesseract_cmd = pyt.pytesseract.tesseract_cmd
+        if ImageManager._tess_version_checked == tesseract_cmd:
+            return
         try:
             tesseract_version = pyt.get_tesseract_version()
             logger.debug("Tesseract version: %s", tesseract_version)
         except pyt.TesseractNotFoundError as exc:
             raise ValueError(
-                f"Tesseract ocr not found! The exe should be in {path_exe}"
+                f"Tesseract ocr not found! The exe should be in {tesseract_cmd}"
             ) from exc
+        ImageManager._tess_version_checked = tesseract_cmd
+
+    @staticmethod
+    def _open_tesserocr():
+        """
+        Opens one tesserocr API kept for every OCR call, so the language
+        model is loaded once instead of spawning tesseract per read. Called
+        on the first read, so managers that never run OCR do not load it.
+
+        Returns:
+            tesserocr.PyTessBaseAPI | None: The API, None when tesserocr is
+                not installed or cannot start, pytesseract is used then.
+        """
+        if tesserocr is None:
+            return None
+        try:
+            api = tesserocr.PyTessBaseAPI()
+        except RuntimeError as exc:
+            logger.warning("tesserocr unavailable, using pytesseract: %s", exc)
+            return None
+        atexit.register(api.End)
+        return api
 
     def load_images(self) -> None:
-        """Load images from the specified folder."""
+        """
+        Map the images of the specified folder. Only the file header is
+        checked here, images are decoded on first use by _get_template.
+        An image can be restricted to a region of the screen with a
+        `<stem>.roi.json` file next to it, as {"roi": [x, y, w, h]}.
+        """
         for photo_path in self.folder_path.iterdir():
-            img_cv = cv2.imread(str(photo_path), cv2.IMREAD_COLOR)
-            if img_cv is None:
+            if photo_path.name.endswith(_ROI_SUFFIX):
+                self._load_roi(photo_path)
+                continue
+            if photo_path.name == _CACHE_DIR:
+                continue
+            if not photo_path.is_file() or not cv2.haveImageReader(
+                str(photo_path)
+            ):
                 logger.warning("Error loading image: %s", photo_path.name)
                 continue
-            self.images_map[photo_path.stem] = img_cv
+            self.images_map[photo_path.stem] = photo_path.resolve()
         logger.debug("Loaded %s images!", len(self.images_map))
 
+    def _load_roi(self, roi_path: Path) -> None:
+        """
+        Reads the screen region an image is searched in.
+
+        Args:
+            roi_path (Path): The `<stem>.roi.json` file.
+        """
+        stem = roi_path.name[:-len(_ROI_SUFFIX)]
+        try:
+            left, top, width, height = json.loads(
+                roi_path.read_text(encoding="utf-8")
+            )["roi"]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Invalid region file %s: %s", roi_path.name, exc)
+            return
+        self._rois[stem] = (int(left), int(top), int(width), int(height))
+
+    def _get_template(self, name: str):
+        """
+        Gets the grayscale template of an image, loading it from the template
+        cache, or decoding it and building its pyramid level, on first use.
+
+        Args:
+            name (str): The name of the image.
+
+        Returns:
+            numpy.ndarray | None: The grayscale template, None if the image
+                is not mapped or cannot be decoded.
+        """
+        template = self.images_gray.get(name)
+        if template is not None:
+            return template
+        photo_path = self.images_map.get(name)
+        if not isinstance(photo_path, Path):
+            return None
+        cached = self._load_cached_template(photo_path)
+        if cached is not None:
+            template, coarse = cached
+            self.images_gray[name] = template
+            if coarse is not None:
+                self.images_coarse[name] = coarse
+            return template
+        img_cv = _read_image(photo_path)
+        if img_cv is None:
+            logger.warning("Error loading image: %s", photo_path.name)
+            del self.images_map[name]
+            return None
+        self.images_map[name] = img_cv
+        template = np.ascontiguousarray(
+            cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY), dtype=np.uint8
+        )
+        self.images_gray[name] = template
+        if min(template.shape) >= _PYRAMID_MIN_SIZE:
+            self.images_coarse[name] = np.ascontiguousarray(
+                _pyramid_down(template)
+            )
+        self._save_cached_template(
+            photo_path, template, self.images_coarse.get(name)
+        )
+        return template
+
+    def _cached_template_path(self, photo_path: Path) -> Path:
+        """
+        Gets the path of the processed template cache of an image.
+
+        Args:
+            photo_path (Path): The image file path.
+
+        Returns:
+            Path: The `.npz` file in the cache folder of the image folder.
+        """
+        return photo_path.parent / _CACHE_DIR / f"{photo_path.name}.npz"
+
+    def _load_cached_template(self, photo_path: Path) -> tuple | None:
+        """
+        Loads the grayscale template and coarse level of an image from the
+        cache, skipping the image decode, when the cache is newer than the
+        image and was built with the same pyramid settings.
+
+        Args:
+            photo_path (Path): The image file path.
+
+        Returns:
+            tuple | None: (template, coarse or None), None on a cache miss.
+        """
+        cache_path = self._cached_template_path(photo_path)
+        try:
+            if cache_path.stat().st_mtime <= photo_path.stat().st_mtime:
+                return None
+            with np.load(cache_path, allow_pickle=False) as cached:
+                if int(cached["levels"]) != _PYRAMID_LEVELS:
+                    return None
+                template = cached["gray"]
+                coarse = cached["coarse"] if "coarse" in cached else None
+        except (OSError, ValueError, KeyError) as exc:
+            if cache_path.exists():
+                logger.debug("Ignoring template cache %s: %s", cache_path, exc)
+            return None
+        if (min(template.shape) >= _PYRAMID_MIN_SIZE) != (coarse is not None):
+            return None
+        return template, coarse
+
+    def _save_cached_template(self, photo_path: Path, template, coarse) -> None:
+        """
+        Saves the grayscale template and coarse level of an image, so the
+        next runs load them instead of decoding the image.
+
+        Args:
+            photo_path (Path): The image file path.
+            template (numpy.ndarray): The grayscale template.
+            coarse (numpy.ndarray | None): The coarse pyramid level.
+        """
+        cache_path = self._cached_template_path(photo_path)
+        arrays = {"gray": template, "levels": np.array(_PYRAMID_LEVELS)}
+        if coarse is not None:
+            arrays["coarse"] = coarse
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            np.savez(cache_path, **arrays)
+        except OSError as exc:
+            logger.debug("Cannot write template cache %s: %s", cache_path, exc)
+
+    def _grab_screen(self, region: Tuple[int] = None) -> tuple:
+        """
+        Grabs the primary monitor, or a region of the screen, straight into
+        a numpy array with mss, without the PIL round-trip of pyautogui.
+        Every screen read of the Image Manager goes through it.
+
+        Args:
+            region (Tuple[int]): (left, top, width, height) to grab.
+                Defaults to None, the whole primary monitor.
+
+        Returns:
+            tuple: The BGRA screen array and the (left, top) screen
+                coordinates of its first pixel.
+        """
+        if self._sct is None:
+            self._sct = mss.mss()
+            self._monitor = self._sct.monitors[1]
+        if region is None:
+            monitor = self._monitor
+        else:
+            monitor = {
+                "left": region[0],
+                "top": region[1],
+                "width": region[2],
+                "height": region[3]
+            }
+        screen = np.asarray(self._sct.grab(monitor))
+        return screen, (monitor["left"], monitor["top"])
+
+    def _search_region(self, name: str, template, screen_gray) -> tuple:
+        """
+        Gets the part of the screen an image is searched in, its region
+        when it has one that fits the image, the whole screen otherwise.
+
+        Args:
+            name (str): The name of the image.
+            template (numpy.ndarray): The grayscale template.
+            screen_gray (numpy.ndarray): The grayscale screen.
+
+        Returns:
+            tuple: The (x, y) screen corner of the region and the region.
+        """
+        roi = self._rois.get(name)
+        if roi is None:
+            return (0, 0), screen_gray
+        left, top, width, height = roi
+        region = screen_gray[top:top + height, left:left + width]
+        if (
+            region.shape[0] >= template.shape[0]
+            and region.shape[1] >= template.shape[1]
+        ):
+            return (left, top), region
+        logger.warning("Region of %s is smaller than the image", name)
+        return (0, 0), screen_gray
+
+    @staticmethod
+    def _match_template(
+        template,
+        coarse,
+        screen_gray,
+        confidence: float,
+        screen_coarse=None
+    ) -> tuple:
+        """
+        Finds the best match of a template on the screen. Templates with a
+        coarse level are first matched on the downsampled screen, then only
+        around the coarse peak at full resolution. Other templates are
+        matched band by band, stopping once one scores above confidence.
+        cv2.matchTemplate already correlates through DFTs on the CPU, an
+        explicit numpy FFT path sharing the screen spectrum was slower.
+
+        Args:
+            template (numpy.ndarray): The grayscale template.
+            coarse (numpy.ndarray | None): The template at the coarse
+                pyramid level, None to match at full resolution only.
+            screen_gray (numpy.ndarray): The grayscale screen.
+            confidence (float): The confidence threshold for image matching.
+            screen_coarse (numpy.ndarray): The screen at the coarse pyramid
+                level, required for templates with a coarse level.
+
+        Returns:
+            tuple: (score, (x, y)) with the top left corner of the match.
+        """
+        if coarse is not None:
+            result = cv2.matchTemplate(
+                screen_coarse, coarse, cv2.TM_CCOEFF_NORMED
+            )
+            _, _, _, peak = cv2.minMaxLoc(result)
+            height, width = template.shape
+            scale = 1 << _PYRAMID_LEVELS
+            left = max(peak[0] * scale - width // 2, 0)
+            top = max(peak[1] * scale - height // 2, 0)
+            roi = screen_gray[
+                top:peak[1] * scale + height + height // 2,
+                left:peak[0] * scale + width + width // 2
+            ]
+            if roi.shape[0] >= height and roi.shape[1] >= width:
+                result = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED)
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
+                return max_val, (left + max_loc[0], top + max_loc[1])
+        return _match_in_bands(screen_gray, template, confidence)
+
+    def locate_any(self, names: List[str], confidence: float) -> tuple:
+        """
+        Locate the first of the given images visible on the screen, matching
+        every grayscale template against a single grab of the screen. The
+        match runs on the CPU, or on the OpenCL device when it was enabled
+        with use_opencl. While the screen stays identical to the previous
+        grab, the previous scores are reused instead of matching again.
+
+        Args:
+            names (List[str]): The names of the images, by priority.
+            confidence (float): The confidence threshold for image matching.
+
+        Returns:
+            tuple: (name, position) of the first image found, None otherwise.
+        """
+        templates = {}
+        for name in names:
+            template = self._get_template(name)
+            if template is None:
+                logger.error("Image %s not mapped, check image folder!", name)
+                continue
+            templates[name] = template
+        if not templates:
+            return None
+        screen, origin = self._grab_screen()
+        if self._last_screen is None or not np.array_equal(
+            screen, self._last_screen
+        ):
+            self._last_screen = screen
+            self._last_matches = {}
+        pending = {
+            name: template
+            for name, template in templates.items()
+            if (name, confidence) not in self._last_matches
+        }
+        matches = None
+        if pending and self._use_opencl:
+            matches = self._match_opencl(pending, screen)
+        elif pending:
+            matches = self._match_cpu(pending, screen, confidence)
+        try:
+            for name, template in templates.items():
+                key = (name, confidence)
+                if key not in self._last_matches:
+                    self._last_matches[key] = next(matches)
+                max_val, max_loc = self._last_matches[key]
+                if max_val >= confidence:
+                    height, width = template.shape
+                    return name, (
+                        origin[0] + max_loc[0] + width // 2,
+                        origin[1] + max_loc[1] + height // 2
+                    )
+                logger.debug("Image %s not found!", name)
+        finally:
+            if matches is not None:
+                matches.close()
+        return None
+
+    def _match_cpu(self, templates: dict, screen, confidence: float) -> tuple:
+        """
+        Matches the templates on the CPU, in parallel on the thread pool
+        when there are several of them.
+
+        Args:
+            templates (dict): The grayscale templates by name, by priority.
+            screen (numpy.ndarray): The BGRA screen.
+            confidence (float): The confidence threshold for image matching.
+
+        Returns:
+            Generator: (score, (x, y)) of each template, in templates order.
+                Closing it cancels the matches not started yet.
+        """
+        screen_gray = cv2.cvtColor(screen, cv2.COLOR_BGRA2GRAY)
+        screen_coarse = None
+        searches = {}
+        for name, template in templates.items():
+            corner, region = self._search_region(name, template, screen_gray)
+            coarse = self.images_coarse.get(name)
+            region_coarse = None
+            if coarse is not None:
+                if region is not screen_gray:
+                    region_coarse = _pyramid_down(region)
+                else:
+                    if screen_coarse is None:
+                        screen_coarse = _pyramid_down(screen_gray)
+                    region_coarse = screen_coarse
+            searches[name] = (
+                template, coarse, corner, region, region_coarse
+            )
+
+        def match(name):
+            template, coarse, corner, region, region_coarse = searches[name]
+            max_val, max_loc = self._match_template(
+                template, coarse, region, confidence, region_coarse
+            )
+            return max_val, (corner[0] + max_loc[0], corner[1] + max_loc[1])
+
+        if len(templates) > 1:
+            return self._match_parallel(match, templates)
+        return (match(name) for name in templates)
+
+    def _match_parallel(self, match, names):
+        """
+        Runs the matches on the thread pool. OpenCV threading is turned off
+        while they run, so the pool threads do not compete with it, and
+        restored once the generator is closed.
+
+        Args:
+            match (Callable): The function matching a template by name.
+            names (Iterable[str]): The names of the templates, by priority.
+
+        Yields:
+            tuple: (score, (x, y)) of each template, in names order.
+        """
+        threads = cv2.getNumThreads()
+        cv2.setNumThreads(1)
+        futures = [self._executor.submit(match, name) for name in names]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            cv2.setNumThreads(threads)
+
+    def _match_opencl(self, templates: dict, screen):
+        """
+        Matches the templates on the OpenCL device. The screen is uploaded
+        and converted to grayscale once, the templates are uploaded on
+        first use and kept on the device.
+
+        Args:
+            templates (dict): The grayscale templates by name, by priority.
+            screen (numpy.ndarray): The BGRA screen.
+
+        Yields:
+            tuple: (score, (x, y)) of each template, in templates order.
+        """
+        screen_umat = cv2.cvtColor(cv2.UMat(screen), cv2.COLOR_BGRA2GRAY)
+        for name, template in templates.items():
+            template_umat = self._templates_umat.get(name)
+            if template_umat is None:
+                template_umat = cv2.UMat(template)
+                self._templates_umat[name] = template_umat
+            corner, region = self._search_region(name, template, screen)
+            region_umat = screen_umat
+            if region is not screen:
+                region_umat = cv2.UMat(
+                    screen_umat,
+                    (corner[1], corner[1] + region.shape[0]),
+                    (corner[0], corner[0] + region.shape[1])
+                )
+            result = cv2.matchTemplate(
+                region_umat, template_umat, cv2.TM_CCOEFF_NORMED
+            )
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            yield max_val, (corner[0] + max_loc[0], corner[1] + max_loc[1])
+
     def locate_image(self, image: str, confidence: float) -> tuple:
         """
         Locate the position of the given image on the screen.
@@ -79,19 +617,8 @@ class ImageManager():
         Returns:
             tuple: The position of the image if found, None otherwise.
         """
-        selected_image = self.images_map.get(image)
-        if selected_image is None:
-            logger.error("Image %s not mapped, check image folder!", image)
-            return None
-        try:
-            return pyautogui.locateCenterOnScreen(
-                selected_image,
-                confidence=confidence,
-                minSearchTime=2
-            )
-        except pyautogui.ImageNotFoundException:
-            logger.debug("Image %s not found!", image)
-            return None
+        found = self.locate_any([image], confidence)
+        return found[1] if found is not None else None
 
     def move_to_image(
         self,
@@ -111,7 +638,6 @@ class ImageManager():
             bool: True if the image is located and the cursor is moved,
                 False otherwise.
         """
-        sleep(0.5)
         position = self.locate_image(name, confidence)
         if position is None:
             logger.debug("Not moved to image %s", name)
@@ -141,7 +667,6 @@ class ImageManager():
             bool: True if the image is located and clicked successfully,
                 False otherwise.
         """
-        sleep(0.5)
         position = self.locate_image(name, confidence)
         if position is None:
             logger.debug("Not clicked %s", name)
@@ -156,13 +681,12 @@ class ImageManager():
         else:
             logger.error("Unknown mouse button: %s", button)
             return False
-        sleep(2)
         return True
 
     def wait_image(
         self,
         name: str,
-        timeout: float = 1,
+        timeout: float = 60,
         confidence: float = 0.85,
         revive_img: str = None
     ) -> bool:
@@ -171,7 +695,8 @@ class ImageManager():
 
         Args:
             name (str): The name of the image.
-            timeout (Tuple): The maximum time to wait (in minutes). Defaults 1.
+            timeout (float): The maximum time to wait (in seconds).
+                Defaults to 60.
             confidence (Tuple): The confidence threshold for image matching.
             revive_img (str): The image to click on to revive the application.
 
@@ -179,24 +704,36 @@ class ImageManager():
             bool: True if the image appears within the timeout period,
                 False otherwise.
         """
-        is_visible = None
-        start_time = datetime.now() + timedelta(minutes=timeout)
-        checkpoint_time = start_time
-        while is_visible is None and datetime.now() < start_time:
-            is_visible = self.locate_image(name, confidence)
-            sleep(0.5)
-            now = datetime.now()
-            if now - checkpoint_time > timedelta(seconds=5):
-                if revive_img is not None:
-                    self.click_image(revive_img)
-                checkpoint_time = now
-        logger.debug("Image %s visible: %s", name, is_visible is not None)
-        return is_visible is not None
+        names = [name] if revive_img is None else [name, revive_img]
+        _locate = self.locate_any
+        _now = monotonic
+        _sleep = sleep
+        is_visible = False
+        interval = 0.05
+        checkpoint_time = _now()
+        end_time = checkpoint_time + timeout
+        while not is_visible and _now() < end_time:
+            found = _locate(names, confidence)
+            is_visible = found is not None and found[0] == name
+            if found is not None and not is_visible:
+                now = _now()
+                if now - checkpoint_time >= 5.0:
+                    pyautogui.click(found[1][0], found[1][1])
+                    checkpoint_time = now
+                    interval = 0.05
+            if not is_visible:
+                remaining = end_time - _now()
+                if remaining <= 0:
+                    break
+                _sleep(min(interval, remaining))
+                interval = min(interval * 2, 0.5)
+        logger.debug("Image %s visible: %s", name, is_visible)
+        return is_visible
 
     def wait_till_visible(
         self,
         name: str,
-        timeout: float | None = 10,
+        timeout: float | None = 600,
         confidence: float = 0.85,
         revive_img: str = None
     ):
@@ -206,8 +743,8 @@ class ImageManager():
 
         Args:
             timeout : (float | None, optional)
-            Time interval to wait for the image to be visible. If set to None,
-            it waits indefinitely until the image is visible. (default is 10)
+            Seconds to wait for the image to be visible. If set to None,
+            it waits indefinitely until the image is visible. (default is 600)
 
         Returns:
             bool, True if the image is visible, False otherwise.
@@ -215,11 +752,101 @@ class ImageManager():
         if timeout is None:
             visible = False
             while not visible:
-                visible = self.wait_image(name, 1, confidence, revive_img)
+                visible = self.wait_image(name, 60, confidence, revive_img)
             return visible
         visible = self.wait_image(name, timeout, confidence, revive_img)
         return visible
 
+    def _read_words(self, img, tesseract_config: str = "") -> List[tuple]:
+        """
+        Reads the words of an image with the persistent tesserocr API, or
+        with pytesseract when tesserocr is not available. Only the page
+        segmentation mode of the config is applied by tesserocr.
+
+        Args:
+            img (numpy.ndarray): The BGR image to read.
+            tesseract_config (str): Additional config options for Tesseract.
+
+        Returns:
+            List[tuple]: (text, left, top, width, height) of each word.
+        """
+        if not self._tess_opened:
+            self._tess_api = self._open_tesserocr()
+            self._tess_opened = True
+        if self._tess_api is None:
+            image_data = pyt.image_to_data(
+                img, config=tesseract_config, output_type=pyt.Output.DICT
+            )
+            return [
+                word
+                for word in zip(
+                    image_data['text'],
+                    image_data['left'],
+                    image_data['top'],
+                    image_data['width'],
+                    image_data['height']
+                )
+                if word[0]
+            ]
+        import PIL.Image
+        psm = _PSM_PATTERN.search(tesseract_config)
+        self._tess_api.SetPageSegMode(
+            int(psm.group(1)) if psm else tesserocr.PSM.AUTO
+        )
+        self._tess_api.SetImage(
+            PIL.Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+        )
+        self._tess_api.Recognize()
+        words = []
+        level = tesserocr.RIL.WORD
+        for result in tesserocr.iterate_level(
+            self._tess_api.GetIterator(), level
+        ):
+            text = result.GetUTF8Text(level)
+            box = result.BoundingBox(level)
+            if text and box is not None:
+                words.append(
+                    (text, box[0], box[1], box[2] - box[0], box[3] - box[1])
+                )
+        return words
+
+    def _ocr_get(
+        self,
+        img,
+        tesseract_config: str = "",
+        cache: bool = True
+    ) -> List[tuple]:
+        """
+        Runs Tesseract over an image, reusing the result of the same image
+        when it was read recently. Images are keyed by a short blake2b
+        digest of their pixels.
+
+        Args:
+            img (numpy.ndarray): The image to read.
+            tesseract_config (str): Additional config options for Tesseract.
+            cache (bool): If False, always runs Tesseract. Used for full
+                screen grabs, which rarely repeat.
+
+        Returns:
+            List[tuple]: (text, left, top, width, height) of each word.
+        """
+        if not cache:
+            return self._read_words(img, tesseract_config)
+        key = (
+            blake2b(img.tobytes(), digest_size=8).digest(),
+            img.shape,
+            tesseract_config
+        )
+        image_data = self._ocr_cache.get(key)
+        if image_data is not None:
+            self._ocr_cache.move_to_end(key)
+            return image_data
+        image_data = self._read_words(img, tesseract_config)
+        self._ocr_cache[key] = image_data
+        if len(self._ocr_cache) > _OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+        return image_data
+
     def move_to_text(
         self,
         name: str,
@@ -231,7 +858,8 @@ class ImageManager():
         Move the mouse pointer to the specified text on the screen.
 
         Args:
-            name (str): text searching image name.
+            name (str): Unused, kept for compatibility. The screenshot is
+                no longer saved to the image folder.
             text_to_search (str): The text to search for.
             offset (Tuple): The offset from the text's position.
             region (Tuple[int]): The region to search within. Defaults to None.
@@ -240,25 +868,22 @@ class ImageManager():
             bool: True if the text is found and mouse movement is successful,
                 False otherwise.
         """
-        if region is not None:
-            offset = (offset[0]+region[0], offset[1]+region[1])
-        image_path = self.folder_path.joinpath(name)
-        if not image_path.exists():
-            logger.error('Image %s is not in the image folder provided', name)
+        screen, origin = self._grab_screen(region)
+        offset = (offset[0]+origin[0], offset[1]+origin[1])
+        img = cv2.cvtColor(screen, cv2.COLOR_BGRA2BGR)
+        words = self._ocr_get(img, cache=region is not None)
+        match = next(
+            (word for word in words if text_to_search in word[0]), None
+        )
+        if match is None:
+            logger.warning("Text %s not found!", text_to_search)
             return False
-        pyautogui.screenshot(image_path, region=region)
-        img = cv2.imread(image_path)
-        image_data = pyt.image_to_data(img, output_type=pyt.Output.DICT)
-        for i in range(len(image_data['level'])):
-            text = image_data['text'][i]
-            if text_to_search in text:
-                center_x = image_data['left'][i] + image_data['width'][i] / 2
-                center_y = image_data['top'][i] + image_data['height'][i] / 2
-                logger.debug("Text %s found!", text)
-                pyautogui.moveTo(center_x + offset[0] , center_y + offset[1])
-                return True
-        logger.warning("Text %s not found!", text_to_search)
-        return False
+        text, left, top, width, height = match
+        center_x = left + width / 2
+        center_y = top + height / 2
+        logger.debug("Text %s found!", text)
+        pyautogui.moveTo(center_x + offset[0] , center_y + offset[1])
+        return True
 
     def wait_text(
         self,
@@ -281,29 +906,37 @@ class ImageManager():
             tesseract_config (str): Additional config options for Tesseract.
 
         Returns:
-            str: True if the text appears within the timeout period,
+            bool: True if the text appears within the timeout period,
                 False otherwise.
         """
-        found=False
+        found = False
+        interval = 0.2
         if region is not None:
             offset = (offset[0]+region[0], offset[1]+region[1])
-        start_time = datetime.now() + timedelta(minutes=timeout)
-        checkpoint_time = start_time
-        while found is None and datetime.now() < start_time:
-            img = cv2.imread(pyautogui.screenshot(region=region))
-            image_data = pyt.image_to_data(
-                img, config=tesseract_config, output_type=pyt.Output.DICT
-            )
-            for i in range(len(image_data['level'])):
-                text = image_data['text'][i]
-                if text_to_search in text:
-                    found = True
-            now = datetime.now()
-            if now - checkpoint_time > timedelta(seconds=5):
+        _grab = self._grab_screen
+        _ocr = self._ocr_get
+        _now = monotonic
+        _sleep = sleep
+        cache = region is not None
+        checkpoint_time = _now()
+        end_time = checkpoint_time + timeout
+        while not found and _now() < end_time:
+            img = cv2.cvtColor(_grab(region)[0], cv2.COLOR_BGRA2BGR)
+            words = _ocr(img, tesseract_config, cache=cache)
+            if any(text_to_search in word[0] for word in words):
+                found = True
+                break
+            now = _now()
+            if now - checkpoint_time >= 5.0:
                 if revive_img is not None:
                     self.click_image(revive_img)
+                    interval = 0.2
                 checkpoint_time = now
-            sleep(1)
+            remaining = end_time - _now()
+            if remaining <= 0:
+                break
+            _sleep(min(interval, remaining))
+            interval = min(interval * 2, 1.0)
         logger.debug("Text %s found: %s", text_to_search, found)
         return found
 